@@ -8,7 +8,7 @@ from typing import Union, List, Iterable, Any, Optional, BinaryIO, overload, Tex
 from bitstring.bits import Bits, BitsType
 from bitstring.bitarray_ import BitArray
 from bitstring.dtypes import Dtype, dtype_register
-from bitstring import utils
+from bitstring import utils, bitstore_helpers
 from bitstring.bitstring_options import Options, Colour
 import copy
 import array
@@ -272,7 +272,11 @@ class Array:
         else:
             if isinstance(iterable, str):
                 raise TypeError("Can't extend an Array with a str.")
-            for item in iterable:
+            values = list(iterable)
+            if (packed := bitstore_helpers.pack_many(self._dtype, values)) is not None:
+                self.data += packed
+                return
+            for item in values:
                 self.data += self._create_element(item)
 
     def insert(self, i: int, x: ElementType) -> None:
@@ -135,6 +135,15 @@ class BitArray(Bits):
             self._bitstore = x._bitstore
             return
 
+    @classmethod
+    def fromstring(cls: TBits, s: str, /) -> TBits:
+        """Create a new bitstring from a formatted string."""
+        x = super().fromstring(s)
+        # The store may be shared with other bitstrings created from the same string.
+        if x._bitstore.immutable:
+            x._bitstore = x._bitstore._copy()
+        return x
+
     def __iadd__(self, bs: BitsType) -> BitArray:
         """Append bs to current bitstring. Return self.
 
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import bitarray
 from bitstring.exceptions import CreationError
-from typing import Union, Iterable, Optional, overload, Iterator, Any
+from typing import Union, Optional, overload, Iterator, Any
 
 
 def offset_slice_indices_lsb0(key: slice, length: int) -> slice:
+    # Fast path for the common case of a unit step with in range, non-negative start and stop.
+    if key.step is None:
+        start = 0 if key.start is None else key.start
+        stop = length if key.stop is None else key.stop
+        if 0 <= start <= stop <= length:
+            return slice(length - stop, length - start)
     # First convert slice to all integers
     # Length already should take account of the offset
     start, stop, step = key.indices(length)
@@ -15,6 +21,13 @@ def offset_slice_indices_lsb0(key: slice, length: int) -> slice:
     return slice(new_start, None if new_stop < 0 else new_stop, step)
 
 def offset_start_stop_lsb0(start: Optional[int], stop: Optional[int], length: int) -> slice:
+    # Fast path for in range, non-negative start and stop, as in offset_slice_indices_lsb0.
+    if start is None:
+        start = 0
+    if stop is None:
+        stop = length
+    if 0 <= start <= stop <= length:
+        return length - stop, length - start
     # First convert slice to all integers
     # Length already should take account of the offset
     start, stop, _ = slice(start, stop, None).indices(length)
@@ -23,6 +36,10 @@ def offset_start_stop_lsb0(start: Optional[int], stop: Optional[int], length: in
     return new_start, new_stop
 
 
+# The number of bytes searched at a time when finding byte-aligned whole-byte bitstrings.
+_FIND_BLOCK_SIZE = 1 << 16
+
+
 class BitStore:
     """A light wrapper around bitarray that does the LSB0 stuff"""
 
@@ -43,6 +60,16 @@ class BitStore:
         x.modified_length = None
         return x
 
+    @classmethod
+    def frombitarray(cls, ba: bitarray.bitarray, /) -> BitStore:
+        # Unlike the BitStore constructor this doesn't copy the bitarray, so it should only be used for
+        # newly created bitarrays that aren't referenced anywhere else.
+        x = super().__new__(cls)
+        x._bitarray = ba
+        x.immutable = False
+        x.modified_length = None
+        return x
+
     @classmethod
     def frombuffer(cls, buffer, /, length: Optional[int] = None) -> BitStore:
         x = super().__new__(cls)
@@ -67,19 +94,23 @@ class BitStore:
         return self._bitarray.tobytes()
 
     def slice_to_uint(self, start: Optional[int] = None, end: Optional[int] = None) -> int:
-        return bitarray.util.ba2int(self.getslice(start, end)._bitarray, signed=False)
+        return bitarray.util.ba2int(self._sub_bitarray(start, end), signed=False)
 
     def slice_to_int(self, start: Optional[int] = None, end: Optional[int] = None) -> int:
-        return bitarray.util.ba2int(self.getslice(start, end)._bitarray, signed=True)
+        return bitarray.util.ba2int(self._sub_bitarray(start, end), signed=True)
 
     def slice_to_hex(self, start: Optional[int] = None, end: Optional[int] = None) -> str:
-        return bitarray.util.ba2hex(self.getslice(start, end)._bitarray)
+        ba = self._sub_bitarray(start, end)
+        if len(ba) % 8 == 0:
+            # bytes.hex is quicker than ba2hex for larger bitstrings.
+            return ba.tobytes().hex()
+        return bitarray.util.ba2hex(ba)
 
     def slice_to_bin(self, start: Optional[int] = None, end: Optional[int] = None) -> str:
-        return self.getslice(start, end)._bitarray.to01()
+        return self._sub_bitarray(start, end).to01()
 
     def slice_to_oct(self, start: Optional[int] = None, end: Optional[int] = None) -> str:
-        return bitarray.util.ba2base(8, self.getslice(start, end)._bitarray)
+        return bitarray.util.ba2base(8, self._sub_bitarray(start, end))
 
     def __iadd__(self, other: BitStore, /) -> BitStore:
         self._bitarray += other._bitarray
@@ -91,16 +122,21 @@ class BitStore:
         return bs
 
     def __eq__(self, other: Any, /) -> bool:
+        if len(self) != len(other):
+            return False
+        # Only compare the bits that are part of the bitstring, not any trailing buffer.
+        if self.modified_length is not None or other.modified_length is not None:
+            return self._bitarray[:len(self)] == other._bitarray[:len(other)]
         return self._bitarray == other._bitarray
 
     def __and__(self, other: BitStore, /) -> BitStore:
-        return BitStore(self._bitarray & other._bitarray)
+        return BitStore.frombitarray(self._bitarray & other._bitarray)
 
     def __or__(self, other: BitStore, /) -> BitStore:
-        return BitStore(self._bitarray | other._bitarray)
+        return BitStore.frombitarray(self._bitarray | other._bitarray)
 
     def __xor__(self, other: BitStore, /) -> BitStore:
-        return BitStore(self._bitarray ^ other._bitarray)
+        return BitStore.frombitarray(self._bitarray ^ other._bitarray)
 
     def __iand__(self, other: BitStore, /) -> BitStore:
         self._bitarray &= other._bitarray
@@ -130,7 +166,38 @@ class BitStore:
         except StopIteration:
             return -1
 
+    def _findall_whole_bytes(self, bs: BitStore, start: int, end: int, right: bool = False) -> Iterator[int]:
+        # A whole-byte bitstring can only be found at byte-aligned positions by searching the bytes directly,
+        # which is much quicker than checking every bit position. It's done in blocks so that finding the first
+        # occurrence in a large bitstring doesn't need it all to be converted to bytes.
+        needle = bs.tobytes()
+        n = len(needle)
+        first_byte = (start + 7) // 8
+        end_byte = end // 8
+        if not right:
+            pos = first_byte
+            while pos + n <= end_byte:
+                chunk = self._bitarray[pos * 8: min(end_byte, pos + _FIND_BLOCK_SIZE + n - 1) * 8].tobytes()
+                p = chunk.find(needle)
+                while p != -1:
+                    yield (pos + p) * 8
+                    p = chunk.find(needle, p + 1)
+                pos += _FIND_BLOCK_SIZE
+        else:
+            pos = end_byte
+            while pos - n >= first_byte:
+                chunk_start = max(first_byte, pos - _FIND_BLOCK_SIZE - n + 1)
+                chunk = self._bitarray[chunk_start * 8: pos * 8].tobytes()
+                p = chunk.rfind(needle)
+                while p != -1:
+                    yield (chunk_start + p) * 8
+                    p = chunk.rfind(needle, 0, p + n - 1)
+                pos -= _FIND_BLOCK_SIZE
+
     def findall_msb0(self, bs: BitStore, start: int, end: int, bytealigned: bool = False) -> Iterator[int]:
+        if bytealigned and len(bs) % 8 == 0:
+            yield from self._findall_whole_bytes(bs, start, end)
+            return
         i = self._bitarray.itersearch(bs._bitarray, start, end)
         if not bytealigned:
             for p in i:
@@ -141,6 +208,9 @@ class BitStore:
                     yield p
 
     def rfindall_msb0(self, bs: BitStore, start: int, end: int, bytealigned: bool = False) -> Iterator[int]:
+        if bytealigned and len(bs) % 8 == 0:
+            yield from self._findall_whole_bytes(bs, start, end, right=True)
+            return
         i = self._bitarray.itersearch(bs._bitarray, start, end, right=True)
         if not bytealigned:
             for p in i:
@@ -151,7 +221,9 @@ class BitStore:
                     yield p
 
     def count(self, value, /) -> int:
-        return self._bitarray.count(value)
+        if self.modified_length is None:
+            return self._bitarray.count(value)
+        return self._bitarray.count(value, 0, self.modified_length)
 
     def clear(self) -> None:
         self._bitarray.clear()
@@ -159,9 +231,13 @@ class BitStore:
     def reverse(self) -> None:
         self._bitarray.reverse()
 
-    def __iter__(self) -> Iterable[bool]:
-        for i in range(len(self)):
-            yield self.getindex(i)
+    def iter_msb0(self) -> Iterator[bool]:
+        ba = self._bitarray if self.modified_length is None else self._bitarray[:self.modified_length]
+        return map(bool, ba)
+
+    def iter_lsb0(self) -> Iterator[bool]:
+        ba = self._bitarray if self.modified_length is None else self._bitarray[:self.modified_length]
+        return map(bool, reversed(ba))
 
     def _copy(self) -> BitStore:
         """Always creates a copy, even if instance is immutable."""
@@ -180,22 +256,33 @@ class BitStore:
     def getslice_withstep_msb0(self, key: slice, /) -> BitStore:
         if self.modified_length is not None:
             key = slice(*key.indices(self.modified_length))
-        return BitStore(self._bitarray.__getitem__(key))
+        return BitStore.frombitarray(self._bitarray.__getitem__(key))
 
     def getslice_withstep_lsb0(self, key: slice, /) -> BitStore:
         key = offset_slice_indices_lsb0(key, len(self))
-        return BitStore(self._bitarray.__getitem__(key))
+        return BitStore.frombitarray(self._bitarray.__getitem__(key))
 
     def getslice_msb0(self, start: Optional[int], stop: Optional[int], /) -> BitStore:
         if self.modified_length is not None:
             key = slice(*slice(start, stop, None).indices(self.modified_length))
             start = key.start
             stop = key.stop
-        return BitStore(self._bitarray[start:stop])
+        return BitStore.frombitarray(self._bitarray[start:stop])
 
     def getslice_lsb0(self, start: Optional[int], stop: Optional[int], /) -> BitStore:
         start, stop = offset_start_stop_lsb0(start, stop, len(self))
-        return BitStore(self._bitarray[start:stop])
+        return BitStore.frombitarray(self._bitarray[start:stop])
+
+    def _sub_bitarray_msb0(self, start: Optional[int], stop: Optional[int], /) -> bitarray.bitarray:
+        # As getslice_msb0, but without wrapping the result in a new BitStore.
+        if self.modified_length is not None:
+            start, stop, _ = slice(start, stop, None).indices(self.modified_length)
+        return self._bitarray[start:stop]
+
+    def _sub_bitarray_lsb0(self, start: Optional[int], stop: Optional[int], /) -> bitarray.bitarray:
+        # As getslice_lsb0, but without wrapping the result in a new BitStore.
+        start, stop = offset_start_stop_lsb0(start, stop, len(self))
+        return self._bitarray[start:stop]
 
     def getindex_lsb0(self, index: int, /) -> bool:
         return bool(self._bitarray.__getitem__(-index - 1))
@@ -236,10 +323,14 @@ class BitStore:
             self._bitarray.invert()
 
     def any_set(self) -> bool:
-        return self._bitarray.any()
+        if self.modified_length is None:
+            return self._bitarray.any()
+        return self._bitarray.find(1, 0, self.modified_length) != -1
 
     def all_set(self) -> bool:
-        return self._bitarray.all()
+        if self.modified_length is None:
+            return self._bitarray.all()
+        return self._bitarray.find(0, 0, self.modified_length) == -1
 
     def __len__(self) -> int:
         return self.modified_length if self.modified_length is not None else len(self._bitarray)
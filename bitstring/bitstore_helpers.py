@@ -2,34 +2,47 @@ from __future__ import annotations
 
 import struct
 import functools
-from typing import Union, Optional, Dict, Callable
+from typing import Union, Optional, Dict, Callable, Any, List, Tuple
 import bitarray
 from bitstring.bitstore import BitStore
 import bitstring
-from bitstring.fp8 import e4m3float_fmt, e5m2float_fmt
+from bitstring.fp8 import FP8Format, e4m3float_fmt, e5m2float_fmt
 
 
 # The size of various caches used to improve performance
 CACHE_SIZE = 256
 
+# Single bit constants used when building the exponential-Golomb codes. These must never be modified.
+_BS_ONE = BitStore('1', immutable=True)
+_BS_ZERO = BitStore('0', immutable=True)
+
+# Precompiled structs used for the float8 conversions.
+_pack_float16 = struct.Struct('>e').pack
+_unpack_uint16 = struct.Struct('>H').unpack
+
 
 def tidy_input_string(s: str) -> str:
     """Return string made lowercase and with all whitespace and underscores removed."""
     try:
+        if ' ' not in s and '_' not in s and '\t' not in s and '\n' not in s and '\r' not in s:
+            # Fast path for the common case of a string with nothing to remove.
+            return s.lower()
         t = s.split()
     except (AttributeError, TypeError):
         raise ValueError(f"Expected str object but received a {type(s)} with value {s}.")
     return ''.join(t).lower().replace('_', '')
 
 
-@functools.lru_cache(CACHE_SIZE)
 def str_to_bitstore(s: str) -> BitStore:
     _, tokens = bitstring.utils.tokenparser(s)
-    bs = BitStore()
+    if len(tokens) == 1:
+        # Already cached and immutable.
+        return bitstore_from_token(*tokens[0])
+    # Appending to the bitarray directly is quicker than using BitStore.__iadd__ for each token.
+    ba = bitarray.bitarray()
     for token in tokens:
-        bs += bitstore_from_token(*token)
-    bs.immutable = True
-    return bs
+        ba += bitstore_from_token(*token)._bitarray
+    return BitStore.frombitarray(ba)
 
 
 def bin2bitstore(binstring: str) -> BitStore:
@@ -52,7 +65,7 @@ def hex2bitstore(hexstring: str) -> BitStore:
         ba = bitarray.util.hex2ba(hexstring)
     except ValueError:
         raise bitstring.CreationError("Invalid symbol in hex initialiser.")
-    return BitStore(ba)
+    return BitStore.frombitarray(ba)
 
 
 def oct2bitstore(octstring: str) -> BitStore:
@@ -62,7 +75,7 @@ def oct2bitstore(octstring: str) -> BitStore:
         ba = bitarray.util.base2ba(8, octstring)
     except ValueError:
         raise bitstring.CreationError("Invalid symbol in oct initialiser.")
-    return BitStore(ba)
+    return BitStore.frombitarray(ba)
 
 
 def ue2bitstore(i: Union[str, int]) -> BitStore:
@@ -70,14 +83,15 @@ def ue2bitstore(i: Union[str, int]) -> BitStore:
     if i < 0:
         raise bitstring.CreationError("Cannot use negative initialiser for unsigned exponential-Golomb.")
     if i == 0:
-        return BitStore('1')
-    tmp = i + 1
-    leadingzeros = -1
-    while tmp > 0:
-        tmp >>= 1
-        leadingzeros += 1
-    remainingpart = i + 1 - (1 << leadingzeros)
-    return BitStore('0' * leadingzeros + '1') + int2bitstore(remainingpart, leadingzeros, False)
+        return _BS_ONE._copy()
+    # The code word is just i + 1 in binary, preceded by one fewer zeros than it has bits.
+    leadingzeros = (i + 1).bit_length() - 1
+    length = 2 * leadingzeros + 1
+    nbytes = (length + 7) // 8
+    ba = bitarray.bitarray()
+    ba.frombytes((i + 1).to_bytes(nbytes, byteorder='big'))
+    del ba[:nbytes * 8 - length]
+    return BitStore.frombitarray(ba)
 
 
 def se2bitstore(i: Union[str, int]) -> BitStore:
@@ -93,15 +107,23 @@ def uie2bitstore(i: Union[str, int]) -> BitStore:
     i = int(i)
     if i < 0:
         raise bitstring.CreationError("Cannot use negative initialiser for unsigned interleaved exponential-Golomb.")
-    return BitStore('1' if i == 0 else '0' + '0'.join(bin(i + 1)[3:]) + '1')
+    if i == 0:
+        return _BS_ONE._copy()
+    # Each bit of i + 1 after the leading one is preceded by a zero, and then a final one is appended.
+    b = bin(i + 1)[3:]
+    ba = bitarray.bitarray(2 * len(b) + 1)
+    ba[0::2] = False
+    ba[1::2] = bitarray.bitarray(b)
+    ba[-1] = True
+    return BitStore.frombitarray(ba)
 
 
 def sie2bitstore(i: Union[str, int]) -> BitStore:
     i = int(i)
     if i == 0:
-        return BitStore('1')
+        return _BS_ONE._copy()
     else:
-        return uie2bitstore(abs(i)) + (BitStore('1') if i < 0 else BitStore('0'))
+        return uie2bitstore(abs(i)) + (_BS_ONE if i < 0 else _BS_ZERO)
 
 
 def bfloat2bitstore(f: Union[str, float], big_endian: bool) -> BitStore:
@@ -115,22 +137,44 @@ def bfloat2bitstore(f: Union[str, float], big_endian: bool) -> BitStore:
     return BitStore.frombytes(b[0:2]) if big_endian else BitStore.frombytes(b[2:4])
 
 
-def e4m3float2bitstore(f: Union[str, float]) -> BitStore:
+def fp8float2bitstore(f: Union[str, float], fmt: FP8Format) -> BitStore:
     f = float(f)
-    u = e4m3float_fmt.float_to_int8(f)
-    return int2bitstore(u, 8, False)
+    # Convert to a float16 and use its bits as the index into the LUT. This is the same as fmt.float_to_int8,
+    # but without the intermediate int.
+    try:
+        i = _unpack_uint16(_pack_float16(f))[0]
+    except (OverflowError, struct.error):
+        # Clip to the largest representable positive or negative value
+        return BitStore.frombytes(b'\x7f' if f > 0 else b'\xff')
+    return BitStore.frombytes(fmt.lut_float16_to_float8[i:i + 1])
+
+
+def e4m3float2bitstore(f: Union[str, float]) -> BitStore:
+    return fp8float2bitstore(f, e4m3float_fmt)
 
 
 def e5m2float2bitstore(f: Union[str, float]) -> BitStore:
-    f = float(f)
-    u = e5m2float_fmt.float_to_int8(f)
-    return int2bitstore(u, 8, False)
+    return fp8float2bitstore(f, e5m2float_fmt)
 
 
 def int2bitstore(i: int, length: int, signed: bool) -> BitStore:
     i = int(i)
+    if 0 < length <= 64:
+        # Fast path for the common small lengths. Out of range values fall through to the general case,
+        # which will raise the appropriate error.
+        if signed:
+            in_range = -(1 << (length - 1)) <= i < (1 << (length - 1))
+        else:
+            in_range = 0 <= i < (1 << length)
+        if in_range:
+            nbytes = (length + 7) >> 3
+            # Negative values are stored as two's complement.
+            u = i + (1 << length) if i < 0 else i
+            x = BitStore.frombytes(u.to_bytes(nbytes, byteorder='big'))
+            del x._bitarray[:nbytes * 8 - length]
+            return x
     try:
-        x = BitStore(bitarray.util.int2ba(i, length=length, endian='big', signed=signed))
+        x = BitStore.frombitarray(bitarray.util.int2ba(i, length=length, endian='big', signed=signed))
     except OverflowError as e:
         if signed:
             if i >= (1 << (length - 1)) or i < -(1 << (length - 1)):
@@ -147,8 +191,15 @@ def int2bitstore(i: int, length: int, signed: bool) -> BitStore:
 
 
 def intle2bitstore(i: int, length: int, signed: bool) -> BitStore:
-    x = int2bitstore(i, length, signed).tobytes()
-    return BitStore.frombytes(x[::-1])
+    if length % 8 != 0:
+        raise bitstring.CreationError(f"Little-endian integers must be whole-byte. Length = {length} bits.")
+    i = int(i)
+    try:
+        b = i.to_bytes(length // 8, byteorder='little', signed=signed)
+    except OverflowError:
+        # int2bitstore will raise the appropriate error.
+        return int2bitstore(i, length, signed)
+    return BitStore.frombytes(b)
 
 
 def float2bitstore(f: Union[str, float], length: int, big_endian: bool) -> BitStore:
@@ -162,6 +213,57 @@ def float2bitstore(f: Union[str, float], length: int, big_endian: bool) -> BitSt
     return BitStore.frombytes(b)
 
 
+# The struct formats for dtypes that can be packed many values at a time, keyed by dtype name and length.
+_pack_many_formats: Dict[Tuple[str, int], str] = {
+    ('uint', 8): '>B', ('uint', 16): '>H', ('uint', 32): '>L', ('uint', 64): '>Q',
+    ('uintbe', 8): '>B', ('uintbe', 16): '>H', ('uintbe', 32): '>L', ('uintbe', 64): '>Q',
+    ('uintle', 8): '<B', ('uintle', 16): '<H', ('uintle', 32): '<L', ('uintle', 64): '<Q',
+    ('int', 8): '>b', ('int', 16): '>h', ('int', 32): '>l', ('int', 64): '>q',
+    ('intbe', 8): '>b', ('intbe', 16): '>h', ('intbe', 32): '>l', ('intbe', 64): '>q',
+    ('intle', 8): '<b', ('intle', 16): '<h', ('intle', 32): '<l', ('intle', 64): '<q',
+    ('float', 16): '>e', ('float', 32): '>f', ('float', 64): '>d',
+    ('floatbe', 16): '>e', ('floatbe', 32): '>f', ('floatbe', 64): '>d',
+    ('floatle', 16): '<e', ('floatle', 32): '<f', ('floatle', 64): '<d',
+}
+
+_fp8_formats: Dict[str, FP8Format] = {'e4m3float': e4m3float_fmt, 'e5m2float': e5m2float_fmt}
+_FLOAT16_MAX = 65504.0
+
+
+def pack_many(dtype: bitstring.dtypes.Dtype, values: List[Any]) -> Optional[bytes]:
+    """Return the values packed as a bytes object, or None if they need to be created one at a time.
+
+    This is much faster than creating a bitstring for each value, but is only possible for some fixed length
+    dtypes. Values that are out of range or not of the expected type also give None, so that the ordinary
+    creation method can either convert them or raise the appropriate exception.
+    """
+    if bitstring.options.lsb0:
+        # Each value would need to be prepended rather than appended.
+        return None
+    n = len(values)
+    if (fmt := _pack_many_formats.get((dtype.name, dtype.length))) is not None:
+        try:
+            return struct.pack(f'{fmt[0]}{n}{fmt[1]}', *values)
+        except (struct.error, OverflowError):
+            return None
+    if (fp8_fmt := _fp8_formats.get(dtype.name)) is not None:
+        try:
+            packed = struct.pack(f'>{n}e', *values)
+        except OverflowError:
+            # Values too large for a float16 would be clipped to the largest float8 anyway, so clip them to the
+            # largest float16 and try again, rather than creating every value one at a time.
+            try:
+                values = [min(max(float(v), -_FLOAT16_MAX), _FLOAT16_MAX) for v in values]
+                packed = struct.pack(f'>{n}e', *values)
+            except (ValueError, TypeError, OverflowError, struct.error):
+                return None
+        except struct.error:
+            return None
+        indices = struct.unpack(f'>{n}H', packed)
+        return bytes(map(fp8_fmt.lut_float16_to_float8.__getitem__, indices))
+    return None
+
+
 literal_bit_funcs: Dict[str, Callable[..., BitStore]] = {
     '0x': hex2bitstore,
     '0X': hex2bitstore,
@@ -173,6 +275,19 @@ literal_bit_funcs: Dict[str, Callable[..., BitStore]] = {
 
 
 def bitstore_from_token(name: str, token_length: Optional[int], value: Optional[str]) -> BitStore:
+    """Cached version of uncached_bitstore_from_token. The BitStore returned is shared so is made immutable."""
+    return _cached_bitstore_from_token(name, token_length, value, bitstring.options.lsb0)
+
+
+@functools.lru_cache(CACHE_SIZE)
+def _cached_bitstore_from_token(name: str, token_length: Optional[int], value: Optional[str], lsb0: bool) -> BitStore:
+    # The lsb0 flag is only part of the key, as some tokens are invalid or created differently in lsb0 mode.
+    bs = uncached_bitstore_from_token(name, token_length, value)
+    bs.immutable = True
+    return bs
+
+
+def uncached_bitstore_from_token(name: str, token_length: Optional[int], value: Any) -> BitStore:
     if name in literal_bit_funcs:
         return literal_bit_funcs[name](value)
     try:
@@ -35,7 +35,8 @@ class Options:
                        '_prepend': BitArray._append_msb0},
             BitStore: {'__setitem__': BitStore.setitem_lsb0, '__delitem__': BitStore.delitem_lsb0,
                        'getindex': BitStore.getindex_lsb0, 'getslice': BitStore.getslice_lsb0,
-                       'getslice_withstep': BitStore.getslice_withstep_lsb0, 'invert': BitStore.invert_lsb0}
+                       'getslice_withstep': BitStore.getslice_withstep_lsb0, 'invert': BitStore.invert_lsb0,
+                       '__iter__': BitStore.iter_lsb0, '_sub_bitarray': BitStore._sub_bitarray_lsb0}
         }
         msb0_methods = {
             Bits: {'_find': Bits._find_msb0, '_rfind': Bits._rfind_msb0, '_findall': Bits._findall_msb0},
@@ -43,7 +44,8 @@ class Options:
                        '_prepend': BitArray._append_lsb0},
             BitStore: {'__setitem__': BitStore.setitem_msb0, '__delitem__': BitStore.delitem_msb0,
                        'getindex': BitStore.getindex_msb0, 'getslice': BitStore.getslice_msb0,
-                       'getslice_withstep': BitStore.getslice_withstep_msb0, 'invert': BitStore.invert_msb0}
+                       'getslice_withstep': BitStore.getslice_withstep_msb0, 'invert': BitStore.invert_msb0,
+                       '__iter__': BitStore.iter_msb0, '_sub_bitarray': BitStore._sub_bitarray_msb0}
         }
         methods = lsb0_methods if self._lsb0 else msb0_methods
         for cls, method_dict in methods.items():
@@ -6,7 +6,7 @@ from bitstring.utils import tokenparser
 from bitstring.exceptions import CreationError
 from typing import Union, List
 from bitstring.bitstore import BitStore
-from bitstring.bitstore_helpers import bitstore_from_token
+from bitstring.bitstore_helpers import uncached_bitstore_from_token
 
 
 def pack(fmt: Union[str, List[str]], *values, **kwargs) -> BitStream:
@@ -76,7 +76,7 @@ def pack(fmt: Union[str, List[str]], *values, **kwargs) -> BitStream:
                     raise CreationError(f"Token with length {length} packed with value of length {len(value)}.")
                 bsl.append(value._bitstore)
                 continue
-            bsl.append(bitstore_from_token(name, length, value))
+            bsl.append(uncached_bitstore_from_token(name, length, value))
     except StopIteration:
         raise CreationError(f"Not enough parameters present to pack according to the "
                             f"format. {len(tokens)} values are needed.")
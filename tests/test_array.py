@@ -57,6 +57,18 @@ class TestCreation:
         b = Array('e4m3float', [100000, -0.0])
         assert a.equals(b)
 
+    def test_creation_packed_all_at_once(self):
+        for dtype, values in [('u8', [0, 1, 255]), ('intle16', [-1, 2, 3]), ('uint64', [2**64 - 1, 0]),
+                              ('f16', [1.5, -2.0, 1e10]), ('floatle32', [0.25, float('inf')]),
+                              ('floatbe64', [-0.5, 1e300]), ('e5m2float', [3.0, -1e10, 0.125]), ('i8', ['7', 8.0, True])]:
+            a = Array(dtype, values)
+            b = Array(dtype)
+            for v in values:
+                b.append(v)
+            assert a.equals(b)
+        with pytest.raises(ValueError):
+            _ = Array('u8', [1, 2, 256])
+
     def test_creation_from_multiple(self):
         with pytest.raises(ValueError):
             _ = Array('2*float16')
@@ -142,6 +142,23 @@ class TestBugs:
         s1.prepend('0b0')
         assert s1.bin == '00111111111111111'
 
+    def test_modifying_after_setting_float_attribute(self):
+        a = BitArray()
+        a.f32 = 1.0
+        a.append('0b1')
+        a.uintle16 = 1
+        a[0] = 1
+        a.bfloat = 2.0
+        a.prepend('0x1')
+        assert a == '0x14000'
+
+    def test_setting_little_endian_int_with_non_whole_byte_length(self):
+        a = BitArray(12)
+        with pytest.raises(bitstring.CreationError):
+            a.uintle = 1
+        with pytest.raises(bitstring.CreationError):
+            a.intle = -1
+
 
 class TestByteAligned:
 
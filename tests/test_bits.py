@@ -251,6 +251,17 @@ class TestInitialisation:
         tp = list(t.findall('0b1'))
         assert tp == [0]
 
+    def test_find_whole_bytes_bytealigned(self):
+        a = Bits(bytes(100000) + b'\xff\x00\xff\x00\xff' + bytes(3))
+        assert a.find('0xff00ff', bytealigned=True) == (800000,)
+        assert a.rfind('0xff00ff', bytealigned=True) == (800016,)
+        assert list(a.findall('0xff00ff', bytealigned=True)) == [800000, 800016]
+        assert list(a.findall('0x00ff', start=799990, end=800040, bytealigned=True)) == [799992, 800008, 800024]
+        assert not a.find('0xff00ff', start=800001, end=800039, bytealigned=True)
+        b = Bits('0x0ff0')
+        assert not b.find('0xff', bytealigned=True)
+        assert b.find('0xff') == (4,)
+
 
 class TestCut:
     def test_cut(self):
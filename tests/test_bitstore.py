@@ -27,6 +27,37 @@ class TestBasicFunctionality:
         with pytest.raises(IndexError):
             _ = a.getindex(-4)
 
+    def test_iterating(self):
+        a = BitStore('0011')
+        assert list(a) == [False, False, True, True]
+        b = BitStore.frombuffer(b'\x0f', length=6)
+        assert list(b) == [False, False, False, False, True, True]
+
+    def test_equality_with_modified_length(self):
+        a = BitStore.frombuffer(b'\x0f', length=6)
+        assert a == BitStore('000011')
+        assert BitStore('000011') == a
+        assert a != BitStore('00001111')
+        assert a == BitStore.frombuffer(b'\x0c', length=6)
+
+    def test_slice_to_with_modified_length(self):
+        a = BitStore.frombuffer(b'\x0f', length=6)
+        assert a.slice_to_bin() == '000011'
+        assert a.slice_to_uint(2, None) == 3
+        assert a.slice_to_int(-3, None) == 3
+        assert a.slice_to_oct() == '03'
+
+    def test_counting_with_modified_length(self):
+        a = BitStore.frombuffer(b'\xf0', length=4)
+        assert a.count(1) == 4
+        assert a.count(0) == 0
+        assert a.all_set()
+        assert a.any_set()
+        b = BitStore.frombuffer(b'\x0f', length=4)
+        assert b.count(1) == 0
+        assert not b.all_set()
+        assert not b.any_set()
+
 
 class TestBasicLSB0Functionality:
 
@@ -71,6 +102,10 @@ class TestBasicLSB0Functionality:
         with pytest.raises(IndexError):
             a[-6] = 0
 
+    def test_iterating(self):
+        a = BitStore('0011')
+        assert list(a) == [True, True, False, False]
+
 
 class TestGettingSlices:
 
@@ -3,6 +3,7 @@
 Module-level unit tests.
 """
 import io
+import pytest
 from unittest import mock
 from contextlib import redirect_stdout
 import bitstring
@@ -198,3 +199,54 @@ class TestNoFixedLengthPackingBug:
         a = bitstring.BitStream(float=14, length=16)
         b = a.read('float')
         assert b == 14.0
+
+
+class TestTokenCaching:
+
+    def test_packing_negative_zero(self):
+        for fmt, negative_zero in [('f32', '0x80000000'), ('f16', '0x8000'), ('bfloat', '0x8000'),
+                                   ('floatle32', '0x00000080')]:
+            assert bitstring.pack(fmt, 0.0).all(False)
+            assert bitstring.pack(fmt, -0.0) == negative_zero
+
+    def test_exp_golomb_not_cached_across_lsb0(self):
+        bitstring.pack('ue, se', 5, -3)
+        _ = bitstring.Bits('ue=5')
+        bitstring.lsb0 = True
+        try:
+            with pytest.raises(bitstring.CreationError):
+                bitstring.pack('ue, se', 5, -3)
+            with pytest.raises(bitstring.CreationError):
+                bitstring.Bits('ue=5')
+        finally:
+            bitstring.lsb0 = False
+
+    def test_packing_unhashable_value(self):
+        a = bitstring.pack('bytes, bytes', bytearray(b'ab'), bytearray(b'ab'))
+        assert a.bytes == b'abab'
+
+    def test_cached_tokens_not_modified(self):
+        a = bitstring.BitArray('u8=5, u8=5')
+        a.append('u8=5')
+        a[0:8] = '0xff'
+        assert bitstring.Bits('u8=5, u8=5') == '0x0505'
+        assert bitstring.pack('u8, u8', 5, 5) == '0x0505'
+
+    def test_fromstring_not_shared(self):
+        a = bitstring.BitArray.fromstring('0xf')
+        a.append('0b1')
+        b = bitstring.BitStream.fromstring('0xf, 0b1')
+        b.append('0b1')
+        assert bitstring.Bits('0xf') == '0xf'
+        assert bitstring.Bits.fromstring('0xf, 0b1') == '0b11111'
+
+    def test_single_bit_codes_not_shared(self):
+        a = bitstring.BitArray(ue=0)
+        a.append('0b1')
+        b = bitstring.BitArray(sie=0)
+        b.invert()
+        c = bitstring.BitArray(sie=-1)
+        c.invert()
+        assert bitstring.Bits(ue=0) == '0b1'
+        assert bitstring.Bits(sie=0) == '0b1'
+        assert bitstring.Bits(sie=-1) == '0b0011'
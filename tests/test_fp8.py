@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 import sys
 import array
+import bisect
 import struct
 import math
 import bitstring
@@ -88,31 +89,23 @@ def createLUT_for_int8_to_float(exp_bits, bias) -> array.array[float]:
 # Create a bytearray where the nth element is the 8 bit float corresponding to the fp16 value interpreted as n.
 def createLUT_for_float16_to_float8(lut_int8_to_float) -> bytes:
     # Used to create the LUT that was compressed and stored for the fp8 code
+    # The positive values (0 to 127) are increasing, and the negative values (129 to 255) are decreasing, so
+    # after negating the latter both halves can be binary searched rather than scanned.
+    positive = lut_int8_to_float[0:128]
+    negated_negative = [-x for x in lut_int8_to_float[129:256]]
     fp16_to_fp8 = bytearray(1 << 16)
-    for i in range(1 << 16):
-        b = struct.pack('>H', i)
-        f, = struct.unpack('>e', b)
-        fp8_i = slow_float_to_int8(lut_int8_to_float, f)
-        fp16_to_fp8[i] = fp8_i
+    for i, (f,) in enumerate(struct.iter_unpack('>e', struct.pack('>65536H', *range(1 << 16)))):
+        fp16_to_fp8[i] = float_to_int8_bisect(positive, negated_negative, f)
     return bytes(fp16_to_fp8)
 
-def slow_float_to_int8(lut_int8_to_float, f: float) -> int:
-    # Slow, but easier to follow than the faster version. Used only for validation.
+def float_to_int8_bisect(positive, negated_negative, f: float) -> int:
+    # Rounds towards zero, clipping to the positive or negative max.
     if f >= 0:
-        for i in range(128):
-            if f < lut_int8_to_float[i]:
-                return i - 1
-        # Clip to positive max
-        return 0b01111111
+        return bisect.bisect_right(positive, f) - 1
     if f < 0:
-        if f > lut_int8_to_float[129]:
-            # Rounding upwards to zero
-            return 0b00000000  # There's no negative zero so this is a special case
-        for i in range(130, 256):
-            if f > lut_int8_to_float[i]:
-                return i - 1
-        # Clip to negative max
-        return 0b11111111
+        j = bisect.bisect_right(negated_negative, -f)
+        # There's no negative zero so small negative values round up to the positive zero
+        return 0b00000000 if j == 0 else j + 128
     # We only have one nan value
     return 0b10000000
 